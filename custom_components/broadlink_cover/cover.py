@@ -1,12 +1,15 @@
-import asyncio
-import time
-import logging
+from datetime import timedelta
+from enum import IntEnum
 
-from homeassistant.components.cover import CoverEntity, CoverEntityFeature
+from homeassistant.components.cover import (
+    CoverDeviceClass,
+    CoverEntity,
+    CoverEntityFeature,
+)
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.restore_state import RestoreEntity
 
-_LOGGER = logging.getLogger(__name__)
-
 SUPPORT_FLAGS = (
     CoverEntityFeature.OPEN
     | CoverEntityFeature.CLOSE
@@ -14,6 +17,20 @@ SUPPORT_FLAGS = (
     | CoverEntityFeature.SET_POSITION
 )
 
+# How often listeners are sent the interpolated position while the cover is moving
+UPDATE_INTERVAL = timedelta(seconds=1)
+# Minimum change in reported position between two state writes while moving
+WRITE_STEP = 2
+
+
+class _State(IntEnum):
+    """Movement state of the cover."""
+
+    IDLE = 0
+    OPENING = 1
+    CLOSING = 2
+
+
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Set up the cover from a config entry."""
     data = config_entry.data
@@ -39,81 +56,61 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
 class BroadlinkRFTimeCover(CoverEntity, RestoreEntity):
     """Representation of a Broadlink RF cover."""
 
+    _attr_supported_features = SUPPORT_FLAGS
+    _attr_device_class = CoverDeviceClass.SHUTTER  # or BLIND if preferred
+
     DEBOUNCE_DELAY = 2.5  # seconds
 
     def __init__(self, hass, name, remote_entity_id, commands, open_time, close_time, entry_id):
         """Initialize the cover entity."""
         self._hass = hass
-        self._name = name
-        self._remote_entity_id = remote_entity_id
-        self._commands = commands
-        self._open_time = open_time
-        self._close_time = close_time
-        self._entry_id = entry_id
-
-        self._position = 0  # 0 = closed, 100 = fully open
-        self._is_moving = False
-        self._last_direction = None
-        self._move_task = None
-
-        self._debounce_task = None
+        self._loop = hass.loop
+        self._services_call = hass.services.async_call
+        # Build the remote.send_command payloads once, they never change for this entity
+        device = commands.get("device")
+        for command_key in ("open", "close", "stop"):
+            if not device or not commands.get(command_key):
+                raise ValueError(f"Missing device or command '{command_key}' in {name}")
+        self._payloads = {
+            command_key: {
+                "entity_id": remote_entity_id,
+                "device": device,
+                "command": commands[command_key],
+            }
+            for command_key in ("open", "close", "stop")
+        }
+        # Seconds of travel per position unit, by direction
+        self._scale = {"open": open_time / 100.0, "close": close_time / 100.0}
+
+        self._attr_name = name
+        # Unique ID combines entry_id and device name
+        self._attr_unique_id = f"broadlink_cover_{entry_id}_{device.lower()}"
+
+        self._set_position(0)  # 0 = closed, 100 = fully open
+        self._set_state(_State.IDLE)
+        self._move_id = 0
+        self._move_handle = None
+        self._cancel_interval = None
+        self._move_start_time = None
+        self._move_start_position = None
+        self._move_target_position = None
+        self._move_duration = None
+
+        self._debounce_handle = None
         self._debounce_target_position = None
-        self._last_debounce_time = 0
-
-        # Track if the cover is opening or closing
-        self._is_opening = False
-        self._is_closing = False
-
-    @property
-    def name(self):
-        """Return the name of the cover."""
-        return self._name
-
-    @property
-    def unique_id(self):
-        """Return a unique ID for the cover (combines entry_id and device name)."""
-        return f"broadlink_cover_{self._entry_id}_{self._commands['device'].lower()}"
-
-    @property
-    def supported_features(self):
-        """Return the features supported by the cover."""
-        return SUPPORT_FLAGS
-
-    @property
-    def is_closed(self):
-        """Return True if the cover is closed."""
-        return self._position == 0
-
-    @property
-    def device_class(self):
-        return "shutter"  # or "blind" if preferred
-
-    @property
-    def current_cover_position(self):
-        """Return the current position of the cover (0-100)."""
-        if self._position is None:
-            return 0
-        return round(self._position)
-
-    @property
-    def is_opening(self):
-        """Return True if the cover is currently opening."""
-        return self._is_opening
-
-    @property
-    def is_closing(self):
-        """Return True if the cover is currently closing."""
-        return self._is_closing
 
     async def async_added_to_hass(self):
         """Restore previous state and position on startup."""
         await super().async_added_to_hass()
         if (last_state := await self.async_get_last_state()) is not None:
             if last_state.state != "unknown":
-                try:
-                    self._position = int(last_state.attributes.get("current_position", 0))
-                except (ValueError, TypeError):
-                    self._position = 0
+                position = last_state.attributes.get("current_position")
+                if isinstance(position, (int, float)):
+                    self._set_position(max(0, min(100, int(position))))
+                elif isinstance(position, str) and position.isdigit():
+                    self._set_position(min(100, int(position)))
+                else:
+                    self._set_position(0)
 
     async def async_open_cover(self, **kwargs):
         """Open the cover."""
@@ -125,68 +122,81 @@ class BroadlinkRFTimeCover(CoverEntity, RestoreEntity):
 
     async def async_stop_cover(self, **kwargs):
         """Stop the cover movement."""
-        if self._move_task:
-            self._move_task.cancel()
-            self._move_task = None
+        # A cover that never started moving has nothing to stop
+        was_moving = self._move_handle is not None or self._state != _State.IDLE
+        self._cancel_move()
 
         # Don't send stop command if already at position 0 or 100
-        if self._position != 0 and self._position != 100:
-            await self._send_code("stop")
+        if was_moving:
+            await self._maybe_send_stop()
 
-        self._is_moving = False
-        self._is_opening = False
-        self._is_closing = False
-        self.async_write_ha_state()
+        # A cancelled move already wrote its final state
+        if self._state != _State.IDLE:
+            self._set_state(_State.IDLE)
+            self.async_write_ha_state()
 
     async def async_set_cover_position(self, **kwargs):
         """Set the position of the cover with debounce."""
-        position = kwargs.get("position", self._position)
-        self._debounce_target_position = position
-        now = time.time()
-        self._last_debounce_time = now
+        self._debounce_target_position = kwargs.get("position", self._position)
 
-        if self._debounce_task:
-            self._debounce_task.cancel()
+        if self._debounce_handle:
+            self._debounce_handle.cancel()
 
-        async def _delayed_set(debounce_time):
-            try:
-                await asyncio.sleep(self.DEBOUNCE_DELAY)
-                # If another task started after this one, skip
-                if debounce_time != self._last_debounce_time:
-                    return
-
-                direction = "open" if self._debounce_target_position > self._position else "close"
-                await self._move_cover(direction, self._debounce_target_position)
-            except asyncio.CancelledError:
-                pass
+        self._debounce_handle = self._loop.call_later(
+            self.DEBOUNCE_DELAY, self._fire_debounced_move
+        )
 
-        self._debounce_task = self._hass.loop.create_task(_delayed_set(now))
+    @callback
+    def _fire_debounced_move(self):
+        """Start the move to the last requested position once the debounce expires."""
+        self._debounce_handle = None
+        direction = (
+            "open" if self._debounce_target_position > self._current_position() else "close"
+        )
+        self._hass.async_create_task(
+            self._move_cover(direction, self._debounce_target_position)
+        )
 
     async def _move_cover(self, direction, target_position):
         """Move the cover to the target position."""
-        if self._move_task:
-            self._move_task.cancel()
-            try:
-                await self._move_task  # Now we wait to update position after cancel
-            except asyncio.CancelledError:
-                pass
+        self._move_id += 1
+        move_id = self._move_id
+        previous_state = self._state
+        # Settle a running move without writing an idle state in between
+        self._halt_move()
 
         # Adjust direction if same as previous and target is same — skip redundant moves
-        if target_position == round(self._position):
+        if target_position == self._position:
+            if self._state != _State.IDLE:
+                self._set_state(_State.IDLE)
+                self.async_write_ha_state()
             return
 
-        # Send the initial command to start moving
-        await self._send_code(direction)
-        self._is_moving = True
-        self._last_direction = direction
-        self._is_opening = direction == "open"
-        self._is_closing = direction == "close"
+        self._set_state(_State.OPENING if direction == "open" else _State.CLOSING)
+        # The motor is already running this way, no need to send the direction again
+        resend = self._state != previous_state
+
+        settled_position = self._position
+        if resend:
+            # ⚡ Instant fractional bump (like in JS code)
+            bump = 1 if direction == "open" else -1
+            self._set_position(max(0, min(100, self._position + bump)))
         self.async_write_ha_state() # Update state immediately for homekit
 
-        # ⚡ Instant fractional bump (like in JS code)
-        bump = 1 if direction == "open" else -1
-        self._position = max(0, min(100, self._position + bump))
-        self.async_write_ha_state()
+        if resend:
+            # Send the initial command to start moving, the timer starts as it goes out
+            try:
+                await self._send_code(direction, blocking=False)
+            except Exception:
+                # Nothing is moving, undo the optimistic state unless a newer move owns it
+                if move_id == self._move_id:
+                    self._set_position(settled_position)
+                    self._set_state(_State.IDLE)
+                    self.async_write_ha_state()
+                raise
+            if move_id != self._move_id:
+                # A newer move took over while the code was being sent
+                return
 
         # Calculate the duration based on direction and target position
         duration = self._calculate_duration(direction, target_position)
@@ -194,71 +204,118 @@ class BroadlinkRFTimeCover(CoverEntity, RestoreEntity):
         if duration <= 0:
             duration = 0.1  # Minimum duration to avoid division by zero
 
-        self._move_task = self._hass.loop.create_task(
-            self._timed_move(direction, duration, target_position)
-        )
+        self._start_timed_move(duration, target_position)
 
     def _calculate_duration(self, direction, target_position):
         """Calculate the duration for the cover to reach the target position."""
-        if direction == "open":
-            distance = target_position - self._position
-            return (distance / 100) * self._open_time
-        else:
-            distance = self._position - target_position
-            return (distance / 100) * self._close_time
-
-    async def _timed_move(self, direction, duration, target_position):
-        """Move the cover over a specified duration, updating the position smoothly."""
-        start_time = time.time()
-        update_interval = 0.25  # seconds
-        steps = max(1, int(duration / update_interval))
-        step_duration = duration / steps
-
-        start_position = self._position
-        position_delta = target_position - start_position
-
-        try:
-            for step in range(1, steps + 1):
-                await asyncio.sleep(step_duration)
-                progress = step / steps
-                self._position = start_position + position_delta * progress
-                self.async_write_ha_state()
+        return abs(target_position - self._position) * self._scale[direction]
 
-            # Final correction
-            self._position = target_position
-            # Only send stop command if not at 0 or 100
-            if self._position != 0 and self._position != 100:
-                await self._send_code("stop")
+    @callback
+    def _start_timed_move(self, duration, target_position):
+        """Schedule the end of the move and the periodic position updates."""
+        # Another move may have started while the direction code was being sent
+        self._halt_move()
 
-        except asyncio.CancelledError:
-            elapsed = time.time() - start_time
-            progress = min(1.0, elapsed / duration)
-            self._position = start_position + position_delta * progress
+        self._move_start_time = start_time = self._loop.time()
+        self._move_start_position = self._position
+        self._move_target_position = target_position
+        self._move_duration = duration
+
+        self._cancel_interval = async_track_time_interval(
+            self._hass, self._update_position, UPDATE_INTERVAL
+        )
+        # Absolute deadline on the same clock reading the position math uses
+        self._move_handle = self._loop.call_at(start_time + duration, self._on_move_complete)
+
+    def _calculate_position(self):
+        """Return the integer position reached so far, based on the elapsed monotonic time."""
+        elapsed = self._loop.time() - self._move_start_time
+        progress = min(1.0, elapsed / self._move_duration)
+        position_delta = self._move_target_position - self._move_start_position
+        # Positions stay integers, truncating towards the start of the move
+        return self._move_start_position + int(position_delta * progress)
+
+    def _current_position(self):
+        """Return the position, interpolated while a move is running."""
+        if self._move_handle is not None:
+            return self._calculate_position()
+        return self._position
+
+    @callback
+    def _update_position(self, now=None):
+        """Write the interpolated position once it moved WRITE_STEP from the last write."""
+        position = self._calculate_position()
+        if abs(position - self._attr_current_cover_position) >= WRITE_STEP:
+            self._set_position(position)
             self.async_write_ha_state()
-            raise
 
-        finally:
-            self._is_moving = False
-            self._is_opening = False
-            self._is_closing = False
+    @callback
+    def _on_move_complete(self):
+        """Finish the move once its duration has elapsed."""
+        self._set_position(self._move_target_position)
+        self._end_move()
+
+        # Full open/close ends at an endstop, don't even schedule the stop task
+        if self._needs_stop():
+            self._hass.async_create_task(self._send_code("stop"))
+
+    @callback
+    def _cancel_move(self):
+        """Cancel the running move, keeping the position reached so far."""
+        if self._halt_move():
+            self._set_state(_State.IDLE)
             self.async_write_ha_state()
 
-    async def _send_code(self, command_key):
-        """Send the RF code to the Broadlink device."""
-        device_name = self._commands.get("device")
-        command_name = self._commands.get(command_key)
+    @callback
+    def _halt_move(self):
+        """Cancel the running move's timers and settle the position, without writing state.
+
+        Returns True if a move was running.
+        """
+        if self._move_handle is None:
+            return False
+
+        self._move_handle.cancel()
+        self._set_position(self._calculate_position())
+        self._stop_tracking()
+        return True
+
+    @callback
+    def _end_move(self):
+        """Stop tracking the current move and write the final state."""
+        self._stop_tracking()
+        self._set_state(_State.IDLE)
+        self.async_write_ha_state()
 
-        if not device_name or not command_name:
-            _LOGGER.warning(f"Missing device or command '{command_key}' in {self._name}")
-            return
+    @callback
+    def _stop_tracking(self):
+        """Drop the move's completion timer and interval tick."""
+        self._move_handle = None
+        self._cancel_interval()
+        self._cancel_interval = None
+
+    def _set_position(self, position):
+        """Store the position and the attributes reported for it."""
+        self._position = self._attr_current_cover_position = position
+        self._attr_is_closed = position == 0
+
+    def _set_state(self, state):
+        """Store the movement state and the attributes reported for it."""
+        self._state = state
+        self._attr_is_opening = state == _State.OPENING
+        self._attr_is_closing = state == _State.CLOSING
+
+    def _needs_stop(self):
+        """Return True unless the cover rests at an endstop, where it stops by itself."""
+        return 0 < self._position < 100
+
+    async def _maybe_send_stop(self):
+        """Send the stop code if the cover needs one."""
+        if self._needs_stop():
+            await self._send_code("stop")
 
-        await self._hass.services.async_call(
-            "remote",
-            "send_command",
-            {
-                "entity_id": self._remote_entity_id,
-                "device": device_name,
-                "command": command_name,
-            },
-            blocking=True,
+    async def _send_code(self, command_key, blocking=True):
+        """Send the RF code to the Broadlink device."""
+        await self._services_call(
+            "remote", "send_command", self._payloads[command_key], blocking=blocking
         )